@@ -9,12 +9,11 @@ Run: source ~/MATS/keys.sh && LD_PRELOAD=/lib/x86_64-linux-gnu/libstdc++.so.6 py
 
 import os
 import sys
-import tempfile
 
 import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from voice_input import save_wav, transcribe, SAMPLE_RATE
+from voice_input import encode_wav, transcribe_bytes, SAMPLE_RATE
 
 
 def test_api_reachable():
@@ -40,11 +39,9 @@ def test_transcribe_silence():
     duration = 1.0
     n = int(SAMPLE_RATE * duration)
     noise = (np.random.randn(n) * 100).astype(np.int16)
-    tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    save_wav([noise], tmp.name)
 
     try:
-        text = transcribe(tmp.name)
+        text = transcribe_bytes(encode_wav([noise]))
         # We don't care what it returns — just that it didn't crash
         print(f"  Got: '{text}'")
         print("  PASS  API call succeeded")
@@ -52,11 +49,6 @@ def test_transcribe_silence():
     except Exception as e:
         print(f"  FAIL  {e}")
         return False
-    finally:
-        try:
-            os.unlink(tmp.name)
-        except OSError:
-            pass
 
 
 def test_transcribe_speech():
@@ -75,11 +67,8 @@ def test_transcribe_speech():
     sd.wait()
     print("  Recording done.")
 
-    tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    save_wav([audio], tmp.name)
-
     try:
-        text = transcribe(tmp.name)
+        text = transcribe_bytes(encode_wav([audio]))
         print(f"  Transcription: '{text}'")
         if text:
             print("  PASS  Got non-empty transcription")
@@ -89,11 +78,6 @@ def test_transcribe_speech():
     except Exception as e:
         print(f"  FAIL  {e}")
         return False
-    finally:
-        try:
-            os.unlink(tmp.name)
-        except OSError:
-            pass
 
 
 if __name__ == "__main__":
@@ -10,11 +10,19 @@ import sys
 import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from voice_input import find_keyboard, is_hotkey_pressed
+from voice_input import find_keyboard, is_hotkey_pressed, HOTKEY_BITS
 import evdev
 from evdev import ecodes
 
 
+def mask(*keys):
+    """Build a HOTKEY_BITS mask from keycodes."""
+    m = 0
+    for k in keys:
+        m |= HOTKEY_BITS[k]
+    return m
+
+
 def test_find_keyboard():
     print("--- test_find_keyboard ---")
     kbd = find_keyboard()
@@ -30,20 +38,20 @@ def test_is_hotkey_pressed():
     print("\n--- test_is_hotkey_pressed (unit) ---")
     passed = 0
     # Positive cases
-    assert is_hotkey_pressed({ecodes.KEY_LEFTMETA, ecodes.KEY_LEFTSHIFT, ecodes.KEY_V})
+    assert is_hotkey_pressed(mask(ecodes.KEY_LEFTMETA, ecodes.KEY_LEFTSHIFT, ecodes.KEY_V))
     passed += 1
-    assert is_hotkey_pressed({ecodes.KEY_RIGHTMETA, ecodes.KEY_RIGHTSHIFT, ecodes.KEY_V})
+    assert is_hotkey_pressed(mask(ecodes.KEY_RIGHTMETA, ecodes.KEY_RIGHTSHIFT, ecodes.KEY_V))
     passed += 1
-    assert is_hotkey_pressed({ecodes.KEY_LEFTMETA, ecodes.KEY_RIGHTSHIFT, ecodes.KEY_V})
+    assert is_hotkey_pressed(mask(ecodes.KEY_LEFTMETA, ecodes.KEY_RIGHTSHIFT, ecodes.KEY_V))
     passed += 1
     # Negative cases
-    assert not is_hotkey_pressed({ecodes.KEY_LEFTMETA, ecodes.KEY_V})  # missing shift
+    assert not is_hotkey_pressed(mask(ecodes.KEY_LEFTMETA, ecodes.KEY_V))  # missing shift
     passed += 1
-    assert not is_hotkey_pressed({ecodes.KEY_LEFTSHIFT, ecodes.KEY_V})  # missing super
+    assert not is_hotkey_pressed(mask(ecodes.KEY_LEFTSHIFT, ecodes.KEY_V))  # missing super
     passed += 1
-    assert not is_hotkey_pressed({ecodes.KEY_LEFTMETA, ecodes.KEY_LEFTSHIFT})  # missing V
+    assert not is_hotkey_pressed(mask(ecodes.KEY_LEFTMETA, ecodes.KEY_LEFTSHIFT))  # missing V
     passed += 1
-    assert not is_hotkey_pressed(set())
+    assert not is_hotkey_pressed(0)
     passed += 1
     print(f"  PASS  All {passed} hotkey logic assertions passed")
     return True
@@ -58,7 +66,7 @@ def test_live_hotkey():
         print("  SKIP  No keyboard")
         return False
 
-    pressed = set()
+    pressed = 0
     detected = False
     start = time.time()
     timeout = 15
@@ -69,10 +77,13 @@ def test_live_hotkey():
                 break
             if event.type != ecodes.EV_KEY:
                 continue
+            bit = HOTKEY_BITS.get(event.code)
+            if bit is None:
+                continue
             if event.value == 1:
-                pressed.add(event.code)
+                pressed |= bit
             elif event.value == 0:
-                pressed.discard(event.code)
+                pressed &= ~bit
             if is_hotkey_pressed(pressed):
                 print("  PASS  Hotkey detected!")
                 detected = True
@@ -4,15 +4,15 @@
 Run: LD_PRELOAD=/lib/x86_64-linux-gnu/libstdc++.so.6 python3 tests/test_recording.py
 """
 
+import io
 import os
 import sys
 import wave
-import tempfile
 
 import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from voice_input import save_wav, play_tone, SAMPLE_RATE, CHANNELS
+from voice_input import encode_wav, play_tone, SAMPLE_RATE, CHANNELS
 
 PASS = 0
 FAIL = 0
@@ -28,9 +28,9 @@ def check(name, condition, detail=""):
         print(f"  FAIL  {name}  {detail}")
 
 
-def test_save_wav():
-    """Create a synthetic WAV and verify its properties."""
-    print("\n--- test_save_wav ---")
+def test_encode_wav():
+    """Encode a synthetic clip and verify the WAV properties."""
+    print("\n--- test_encode_wav ---")
     duration_s = 1.0
     n_samples = int(SAMPLE_RATE * duration_s)
     # 440 Hz sine wave, int16
@@ -38,24 +38,18 @@ def test_save_wav():
     samples = (0.5 * np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
     frames = [samples[:n_samples // 2], samples[n_samples // 2:]]
 
-    tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-    try:
-        save_wav(frames, tmp.name)
+    wav_bytes = encode_wav(frames)
 
-        check("file exists", os.path.exists(tmp.name))
-        check("file > 0 bytes", os.path.getsize(tmp.name) > 0,
-              f"size={os.path.getsize(tmp.name)}")
+    check("non-empty bytes", len(wav_bytes) > 0, f"size={len(wav_bytes)}")
 
-        with wave.open(tmp.name, "rb") as wf:
-            check("channels == 1", wf.getnchannels() == CHANNELS)
-            check("sample width == 2", wf.getsampwidth() == 2)
-            check("frame rate == 16000", wf.getframerate() == SAMPLE_RATE)
-            n = wf.getnframes()
-            check("frame count matches",
-                  abs(n - n_samples) < 10,
-                  f"expected ~{n_samples}, got {n}")
-    finally:
-        os.unlink(tmp.name)
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        check("channels == 1", wf.getnchannels() == CHANNELS)
+        check("sample width == 2", wf.getsampwidth() == 2)
+        check("frame rate == 16000", wf.getframerate() == SAMPLE_RATE)
+        n = wf.getnframes()
+        check("frame count matches",
+              abs(n - n_samples) < 10,
+              f"expected ~{n_samples}, got {n}")
 
 
 def test_silence_detection():
@@ -101,18 +95,16 @@ def test_record_short_clip():
               f"shape={audio.shape}")
         check("dtype is int16", audio.dtype == np.int16)
 
-        # Save and re-read
-        tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        save_wav([audio], tmp.name)
-        size = os.path.getsize(tmp.name)
-        check("WAV file size reasonable", size > 100, f"size={size}")
-        os.unlink(tmp.name)
+        # Encode and check
+        wav_bytes = encode_wav([audio])
+        check("WAV size reasonable", len(wav_bytes) > 100,
+              f"size={len(wav_bytes)}")
     except Exception as e:
         check("recording works", False, str(e))
 
 
 if __name__ == "__main__":
-    test_save_wav()
+    test_encode_wav()
     test_silence_detection()
     test_play_tone()
     test_record_short_clip()
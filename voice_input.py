@@ -9,18 +9,21 @@ is typed into the focused window.
 import os
 import sys
 import time
-import wave
+import select
 import signal
+import shutil
+import struct
 import logging
-import tempfile
 import threading
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import numpy as np
 import sounddevice as sd
 import evdev
 from evdev import UInput, ecodes
 import requests
+import webrtcvad
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -32,6 +35,22 @@ MIN_DURATION_S = 0.5
 TONE_VOLUME = 0.25
 TONE_DURATION_S = 0.12
 
+# Streaming segmentation: chop the recording on pauses and transcribe
+# segments while the user is still speaking.
+VAD_MODE = 2                # webrtcvad aggressiveness (0-3)
+VAD_FRAME_MS = 30           # webrtcvad only accepts 10/20/30 ms frames
+VAD_FRAME_SAMPLES = SAMPLE_RATE * VAD_FRAME_MS // 1000
+SEGMENT_SILENCE_S = 1.2     # trailing silence that closes an utterance
+FLUSH_SILENCE_S = 2.5       # silence long enough to upload the pending batch
+MAX_BATCH_S = 25            # upload before a batch outgrows this length
+TRANSCRIBE_WORKERS = 4      # parallel in-flight Whisper requests
+RMS_SILENCE_THRESHOLD = 150  # ~-47 dBFS; quieter batches skip the API call
+
+# Capture: 20 ms blocks with PortAudio's low-latency hint; the callback
+# writes into a preallocated ring so it never allocates or takes locks.
+BLOCK_SAMPLES = 320         # 20 ms at 16 kHz
+MAX_RECORD_S = 600          # ring capacity; recording is dropped beyond this
+
 # Hotkey: Super+Shift+V  (override with VOICE_INPUT_HOTKEY env var)
 HOTKEY_CODES = {ecodes.KEY_V}
 HOTKEY_MODS_LEFT = {ecodes.KEY_LEFTMETA, ecodes.KEY_LEFTSHIFT}
@@ -43,9 +62,20 @@ LOG_FILE = os.path.join(LOG_DIR, "voice-input.log")
 WHISPER_URL = "https://api.openai.com/v1/audio/transcriptions"
 WHISPER_MODEL = "whisper-1"
 
+# Upload codec: Opus at 24 kbps shrinks a WAV upload ~10x with negligible
+# accuracy loss on 16 kHz speech. Needs ffmpeg; anything else (or "wav")
+# uploads plain WAV. Override with VOICE_INPUT_UPLOAD_CODEC=wav.
+UPLOAD_CODEC = os.environ.get("VOICE_INPUT_UPLOAD_CODEC", "opus").lower()
+OPUS_BITRATE = "24k"
+
 # How long to wait (s) after pasting before restoring clipboard
 PASTE_SETTLE_S = 0.15
 
+# How long the virtual Ctrl-V is held down. 8 ms is plenty for Wayland
+# compositors to deliver ordered events from a UInput device; raise via the
+# env var if some app drops fast synthetic keystrokes.
+KEY_HOLD_S = float(os.environ.get("VOICE_INPUT_KEY_HOLD_S", "0.008"))
+
 
 # ---------------------------------------------------------------------------
 # Logging setup
@@ -70,48 +100,107 @@ log = logging.getLogger("voice-input")
 # Audio helpers
 # ---------------------------------------------------------------------------
 
-def play_tone(freq_hz: int, duration_s: float = TONE_DURATION_S):
-    """Play a short sine-wave beep through the default output."""
+def _make_tone(freq_hz: int, duration_s: float) -> np.ndarray:
     t = np.linspace(0, duration_s, int(SAMPLE_RATE * duration_s), dtype=np.float32)
-    tone = (TONE_VOLUME * np.sin(2 * np.pi * freq_hz * t)).astype(np.float32)
+    return (TONE_VOLUME * np.sin(2 * np.pi * freq_hz * t)).astype(np.float32)
+
+
+# Beep buffers prebuilt at import so the hotkey handler never synthesizes
+# audio (or pays the first-use numpy ufunc cost) when feedback should be
+# immediate.
+_TONES = {freq: _make_tone(freq, TONE_DURATION_S) for freq in (440, 880)}
+
+
+def play_tone(freq_hz: int, duration_s: float = TONE_DURATION_S):
+    """Play a short sine-wave beep through the default output (non-blocking)."""
+    tone = _TONES.get(freq_hz) if duration_s == TONE_DURATION_S else None
+    if tone is None:
+        tone = _make_tone(freq_hz, duration_s)
     try:
-        sd.play(tone, samplerate=SAMPLE_RATE, blocking=True)
+        sd.play(tone, samplerate=SAMPLE_RATE, blocking=False)
     except Exception as e:
         log.warning("Could not play tone: %s", e)
 
 
-def save_wav(frames: list[np.ndarray], path: str):
-    """Concatenate recorded frames and write a 16-bit mono WAV."""
-    audio = np.concatenate(frames, axis=0)
-    # Ensure int16
-    if audio.dtype != np.int16:
-        audio = (audio * 32767).astype(np.int16)
-    with wave.open(path, "wb") as wf:
-        wf.setnchannels(CHANNELS)
-        wf.setsampwidth(2)
-        wf.setframerate(SAMPLE_RATE)
-        wf.writeframes(audio.tobytes())
-    return path
+# Canonical 44-byte WAV header for 16 kHz mono int16 PCM; per clip only the
+# two length fields need patching, which skips `wave`'s internal re-copy of
+# every frame buffer it is handed.
+_WAV_HEADER = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF", 0, b"WAVE",
+    b"fmt ", 16, 1, CHANNELS, SAMPLE_RATE, SAMPLE_RATE * CHANNELS * 2,
+    CHANNELS * 2, 16,
+    b"data", 0,
+)
+
+
+def encode_wav(frames: list[np.ndarray]) -> bytes:
+    """Concatenate recorded frames and return them as 16-bit mono WAV bytes."""
+    # Fill one preallocated buffer instead of np.concatenate — avoids an
+    # extra full copy of the recording on the stop → upload path.
+    audio = np.empty(sum(f.size for f in frames), dtype=np.int16)
+    off = 0
+    for f in frames:
+        chunk = f.ravel()
+        if chunk.dtype != np.int16:
+            chunk = (chunk * 32767).astype(np.int16)
+        audio[off:off + chunk.size] = chunk
+        off += chunk.size
+    n = audio.nbytes
+    hdr = bytearray(_WAV_HEADER)
+    struct.pack_into("<I", hdr, 4, 36 + n)   # RIFF chunk size
+    struct.pack_into("<I", hdr, 40, n)       # data chunk size
+    return bytes(hdr) + audio.tobytes()
+
+
+_FFMPEG = shutil.which("ffmpeg")
+
+
+def encode_opus(pcm: bytes) -> bytes | None:
+    """Encode raw int16 mono PCM to Opus-in-Ogg via ffmpeg, or None on failure."""
+    if _FFMPEG is None:
+        return None
+    try:
+        r = subprocess.run(
+            [_FFMPEG, "-loglevel", "error",
+             "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", str(CHANNELS),
+             "-i", "-",
+             "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-f", "ogg", "-"],
+            input=pcm, capture_output=True, timeout=10,
+        )
+    except Exception as e:
+        log.warning("Opus encode failed: %s", e)
+        return None
+    if r.returncode != 0 or not r.stdout:
+        log.warning("Opus encode failed: %s", r.stderr[:200])
+        return None
+    return r.stdout
 
 
 # ---------------------------------------------------------------------------
 # Whisper API
 # ---------------------------------------------------------------------------
 
-def transcribe(audio_path: str) -> str:
-    """Send a WAV file to OpenAI Whisper and return the transcribed text."""
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY environment variable is not set")
-
-    with open(audio_path, "rb") as f:
-        resp = requests.post(
-            WHISPER_URL,
-            headers={"Authorization": f"Bearer {api_key}"},
-            files={"file": ("recording.wav", f, "audio/wav")},
-            data={"model": WHISPER_MODEL},
-            timeout=30,
-        )
+# Shared session so every call reuses the same keep-alive connection
+# instead of paying a fresh TCP+TLS handshake (100-300 ms) per request.
+_SESSION = requests.Session()
+
+
+def transcribe_bytes(audio_bytes: bytes, filename: str = "recording.wav",
+                     mime: str = "audio/wav") -> str:
+    """Send an in-memory audio file to OpenAI Whisper and return the text."""
+    if "Authorization" not in _SESSION.headers:
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise RuntimeError("OPENAI_API_KEY environment variable is not set")
+        _SESSION.headers["Authorization"] = f"Bearer {api_key}"
+
+    resp = _SESSION.post(
+        WHISPER_URL,
+        files={"file": (filename, audio_bytes, mime)},
+        data={"model": WHISPER_MODEL},
+        timeout=30,
+    )
 
     if resp.status_code != 200:
         raise RuntimeError(f"Whisper API {resp.status_code}: {resp.text[:200]}")
@@ -119,10 +208,39 @@ def transcribe(audio_path: str) -> str:
     return resp.json().get("text", "").strip()
 
 
+def transcribe(audio_path: str) -> str:
+    """Send a WAV file to OpenAI Whisper and return the transcribed text."""
+    with open(audio_path, "rb") as f:
+        return transcribe_bytes(f.read())
+
+
+def warm_session():
+    """Prime DNS + TCP + TLS on the shared session with a cheap request.
+
+    Run in the background at startup so the first real transcription
+    reuses a warm keep-alive connection instead of paying the full
+    handshake (~200-400 ms on a typical WAN). Failures don't matter.
+    """
+    try:
+        _SESSION.get("https://api.openai.com/v1/models", timeout=5)
+    except Exception as e:
+        log.debug("Session warmup failed: %s", e)
+
+
 # ---------------------------------------------------------------------------
 # Text insertion  (clipboard + Ctrl-V via UInput)
 # ---------------------------------------------------------------------------
 
+_UNSET = object()  # "no clipboard snapshot supplied" (None means empty/failed)
+
+# Binaries resolved once so clipboard calls skip the PATH walk. Talking
+# wl_data_device/zwlr_data_control directly was considered, but the former
+# needs keyboard focus this daemon never holds and the latter has no shipped
+# pywayland bindings — wl-clipboard stays, with the subprocess cost trimmed.
+_WL_COPY = shutil.which("wl-copy") or "wl-copy"
+_WL_PASTE = shutil.which("wl-paste") or "wl-paste"
+
+
 class TextInserter:
     """Paste text into the focused window via clipboard + virtual Ctrl-V."""
 
@@ -140,7 +258,7 @@ class TextInserter:
         """Return current clipboard text, or None on failure."""
         try:
             r = subprocess.run(
-                ["wl-paste", "--no-newline"],
+                [_WL_PASTE, "--no-newline"],
                 capture_output=True, text=True, timeout=2,
             )
             return r.stdout if r.returncode == 0 else None
@@ -149,7 +267,8 @@ class TextInserter:
 
     @staticmethod
     def _clip_set(text: str):
-        subprocess.run(["wl-copy", "--", text], check=True, timeout=2)
+        # Text goes via stdin — no argv copy, no E2BIG on long transcripts
+        subprocess.run([_WL_COPY], input=text, text=True, check=True, timeout=2)
 
     # -- virtual Ctrl-V -----------------------------------------------------
 
@@ -158,16 +277,21 @@ class TextInserter:
         ui.write(ecodes.EV_KEY, ecodes.KEY_LEFTCTRL, 1)
         ui.write(ecodes.EV_KEY, ecodes.KEY_V, 1)
         ui.syn()
-        time.sleep(0.04)
+        time.sleep(KEY_HOLD_S)
         ui.write(ecodes.EV_KEY, ecodes.KEY_V, 0)
         ui.write(ecodes.EV_KEY, ecodes.KEY_LEFTCTRL, 0)
         ui.syn()
 
     # -- public API ---------------------------------------------------------
 
-    def type_text(self, text: str):
-        """Paste *text* into the focused window (clipboard round-trip)."""
-        old = self._clip_get()
+    def type_text(self, text: str, old=_UNSET):
+        """Paste *text* into the focused window (clipboard round-trip).
+
+        *old* is the clipboard content to restore afterwards; pass it when
+        it was snapshotted ahead of time, otherwise it is fetched here.
+        """
+        if old is _UNSET:
+            old = self._clip_get()
         self._clip_set(text)
         time.sleep(0.05)
         self._press_ctrl_v()
@@ -184,36 +308,149 @@ class TextInserter:
 # Keyboard / hotkey  (evdev)
 # ---------------------------------------------------------------------------
 
+# The resolved keyboard rarely changes between runs, so it is cached by
+# fingerprint and only the full /dev/input scan (an ioctl per device node)
+# runs on a miss or mismatch.
+KBD_CACHE_FILE = os.path.join(LOG_DIR, "keyboard.path")
+
+
+def _kbd_fingerprint(dev: evdev.InputDevice) -> str:
+    return f"{dev.info.vendor:04x}:{dev.info.product:04x}:{dev.name}"
+
+
+def _is_keyboard(dev: evdev.InputDevice) -> bool:
+    caps = dev.capabilities()
+    if ecodes.EV_KEY not in caps:
+        return False
+    keys = set(caps[ecodes.EV_KEY])
+    # A real keyboard has letter keys
+    return ecodes.KEY_A in keys and ecodes.KEY_Z in keys
+
+
+def _load_cached_keyboard() -> evdev.InputDevice | None:
+    try:
+        with open(KBD_CACHE_FILE) as f:
+            fingerprint, path = f.read().rstrip("\n").split("\t")
+    except (OSError, ValueError):
+        return None
+    try:
+        dev = evdev.InputDevice(path)
+    except OSError:
+        return None
+    if _kbd_fingerprint(dev) == fingerprint and _is_keyboard(dev):
+        log.info("Using cached keyboard: %s (%s)", dev.name, dev.path)
+        return dev
+    dev.close()
+    return None
+
+
+def _cache_keyboard(dev: evdev.InputDevice):
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        with open(KBD_CACHE_FILE, "w") as f:
+            f.write(f"{_kbd_fingerprint(dev)}\t{dev.path}\n")
+    except OSError as e:
+        log.warning("Could not cache keyboard path: %s", e)
+
+
 def find_keyboard() -> evdev.InputDevice | None:
-    """Return the first real keyboard device found."""
+    """Return the first real keyboard device found (cached path first)."""
+    dev = _load_cached_keyboard()
+    if dev is not None:
+        return dev
     for path in evdev.list_devices():
         dev = evdev.InputDevice(path)
-        caps = dev.capabilities()
-        if ecodes.EV_KEY not in caps:
-            dev.close()
-            continue
-        keys = set(caps[ecodes.EV_KEY])
-        # A real keyboard has letter keys
-        if ecodes.KEY_A in keys and ecodes.KEY_Z in keys:
+        if _is_keyboard(dev):
             log.info("Using keyboard: %s (%s)", dev.name, dev.path)
+            _cache_keyboard(dev)
             return dev
         dev.close()
     return None
 
 
-def is_hotkey_pressed(pressed: set[int]) -> bool:
-    """Check whether the Super+Shift+V combo is currently held."""
-    has_super = bool(pressed & {ecodes.KEY_LEFTMETA, ecodes.KEY_RIGHTMETA})
-    has_shift = bool(pressed & {ecodes.KEY_LEFTSHIFT, ecodes.KEY_RIGHTSHIFT})
-    has_v = ecodes.KEY_V in pressed
-    return has_super and has_shift and has_v
+# Hotkey state lives in a 5-bit mask — one bit per relevant key — so the
+# per-event check is a couple of integer ANDs instead of set churn, and
+# events for any other key are skipped outright.
+HOTKEY_BITS = {
+    ecodes.KEY_LEFTMETA: 1 << 0,
+    ecodes.KEY_RIGHTMETA: 1 << 1,
+    ecodes.KEY_LEFTSHIFT: 1 << 2,
+    ecodes.KEY_RIGHTSHIFT: 1 << 3,
+    ecodes.KEY_V: 1 << 4,
+}
+_META_MASK = 0b00011
+_SHIFT_MASK = 0b01100
+_V_MASK = 0b10000
+
+# struct input_event from <linux/input.h>: timeval (2 longs), type, code,
+# value. Decoding this directly from the fd skips evdev's per-event
+# InputEvent object construction on the hottest loop in the file.
+_INPUT_EVENT_FMT = "llHHi"
+_INPUT_EVENT_SIZE = struct.calcsize(_INPUT_EVENT_FMT)
+
+
+def is_hotkey_pressed(mask: int) -> bool:
+    """Check whether the Super+Shift+V combo is held in the key bitmask."""
+    return bool(mask & _META_MASK and mask & _SHIFT_MASK and mask & _V_MASK)
 
 
 # ---------------------------------------------------------------------------
 # Desktop notifications
 # ---------------------------------------------------------------------------
 
+# Sent straight over D-Bus (jeepney, pure Python) when available so nothing
+# forks on the hotkey path; falls back to notify-send otherwise.
+try:
+    from jeepney import DBusAddress, new_method_call
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:
+    open_dbus_connection = None
+
+NOTIFY_DEDUPE_S = 0.5
+_URGENCY_LEVELS = {"low": 0, "normal": 1, "critical": 2}
+
+_notify_conn = None
+_notify_lock = threading.Lock()
+_last_notify: tuple[tuple[str, str], float] = (("", ""), 0.0)
+
+
+def _notify_dbus(title: str, body: str, urgency: str) -> bool:
+    """Send via org.freedesktop.Notifications; returns False on any failure."""
+    global _notify_conn
+    if open_dbus_connection is None:
+        return False
+    try:
+        with _notify_lock:
+            if _notify_conn is None:
+                _notify_conn = open_dbus_connection(bus="SESSION")
+            addr = DBusAddress(
+                "/org/freedesktop/Notifications",
+                bus_name="org.freedesktop.Notifications",
+                interface="org.freedesktop.Notifications",
+            )
+            hints = {"urgency": ("y", _URGENCY_LEVELS.get(urgency, 1))}
+            msg = new_method_call(
+                addr, "Notify", "susssasa{sv}i",
+                ("voice-input", 0, "", title, body, [], hints, -1),
+            )
+            _notify_conn.send(msg)
+        return True
+    except Exception:
+        _notify_conn = None  # reconnect on next call
+        return False
+
+
 def notify(title: str, body: str = "", urgency: str = "normal"):
+    global _last_notify
+    # Coalesce identical notifications fired in quick succession
+    key = (title, body)
+    now = time.monotonic()
+    if key == _last_notify[0] and now - _last_notify[1] < NOTIFY_DEDUPE_S:
+        return
+    _last_notify = (key, now)
+
+    if _notify_dbus(title, body, urgency):
+        return
     try:
         subprocess.Popen(
             ["notify-send", f"--urgency={urgency}", title, body],
@@ -230,67 +467,226 @@ def notify(title: str, body: str = "", urgency: str = "normal"):
 class VoiceInputApp:
     def __init__(self):
         self.recording = False
-        self.frames: list[np.ndarray] = []
-        self.stream: sd.InputStream | None = None
+        self.stream: sd.RawInputStream | None = None
         self.inserter: TextInserter | None = None
         self._shutdown = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS)
+        # Separate small pool for assemble+paste: it blocks on transcription
+        # futures, so sharing _executor could deadlock, and the 2-worker cap
+        # bounds how many stops can be in flight. Pastes serialize on a lock
+        # so overlapping transcriptions can't interleave their keystrokes.
+        self._handler_exec = ThreadPoolExecutor(max_workers=2,
+                                                thread_name_prefix="vi-handle")
+        self._paste_lock = threading.Lock()
+        self._vad = webrtcvad.Vad(VAD_MODE)
+        self._worker: threading.Thread | None = None
+        self._futures: list = []
+        # Preallocated capture ring: the callback only memmoves into it and
+        # bumps the write index; the segment worker drains behind it. Plain
+        # bytearray + memoryview so the callback is a C-level slice copy with
+        # no numpy dispatch at all. _widx counts samples, the ring is bytes.
+        self._ring = bytearray(SAMPLE_RATE * MAX_RECORD_S * 2)
+        self._ring_mv = memoryview(self._ring)
+        self._ring_samples = SAMPLE_RATE * MAX_RECORD_S
+        self._widx = 0
+        self._ring_full = False
+        # Persistent output stream for the beeps — opened once in run() so a
+        # hotkey press never waits on PortAudio device negotiation.
+        self._out: sd.OutputStream | None = None
+        self._tone: np.ndarray | None = None
+        self._tone_pos = 0
+
+    # -- feedback beeps -----------------------------------------------------
+
+    def _output_callback(self, outdata, frames, _time, _status):
+        tone = self._tone
+        if tone is None:
+            outdata.fill(0)
+            return
+        n = min(frames, tone.size - self._tone_pos)
+        outdata[:n, 0] = tone[self._tone_pos:self._tone_pos + n]
+        if n < frames:
+            outdata[n:, 0] = 0
+        self._tone_pos += n
+        if self._tone_pos >= tone.size:
+            self._tone = None
+
+    def _beep(self, freq_hz: int):
+        """Queue a beep on the persistent output stream (fallback: sd.play)."""
+        if self._out is None:
+            play_tone(freq_hz)
+            return
+        self._tone_pos = 0
+        self._tone = _TONES[freq_hz]
 
     # -- recording ----------------------------------------------------------
 
-    def _audio_callback(self, indata, _frames, _time, status):
+    def _audio_callback(self, indata, frames, _time, status):
         if status:
             log.warning("Audio callback status: %s", status)
-        if self.recording:
-            self.frames.append(indata.copy())
-
-    def start_recording(self):
-        self.frames = []
-        self.recording = True
-        self.stream = sd.InputStream(
+        if not self.recording:
+            return
+        end = self._widx + frames
+        if end > self._ring_samples:
+            if not self._ring_full:
+                self._ring_full = True
+                log.warning("Recording exceeded %ds, dropping audio", MAX_RECORD_S)
+            return
+        self._ring_mv[self._widx * 2:end * 2] = indata
+        self._widx = end
+
+    def _open_input_stream(self) -> sd.RawInputStream:
+        stream = sd.RawInputStream(
             samplerate=SAMPLE_RATE,
+            blocksize=BLOCK_SAMPLES,
             channels=CHANNELS,
             dtype="int16",
+            latency="low",
             callback=self._audio_callback,
         )
-        self.stream.start()
-        play_tone(880)  # high beep → recording started
+        stream.start()
+        return stream
+
+    def start_recording(self):
+        self._widx = 0
+        self._ring_full = False
+        self._futures = []
+        if self.stream is None:
+            # Normally pre-opened in run(); opened on demand if that failed
+            self.stream = self._open_input_stream()
+        self.recording = True
+        self._worker = threading.Thread(
+            target=self._segment_worker,
+            args=(self._futures,),
+            daemon=True,
+        )
+        self._worker.start()
+        self._beep(880)  # high beep → recording started
         log.info("Recording started")
         notify("Voice Input", "Recording...")
 
-    def stop_recording(self) -> str | None:
-        """Stop recording. Return path to temp WAV, or None if too short."""
+    def stop_recording(self) -> tuple[threading.Thread, list, Future] | None:
+        """Stop recording.
+
+        Returns (worker, futures, clip_future) to await, or None if the
+        recording was too short. The clipboard snapshot is kicked off here —
+        it has no dependency on the transcription, so it runs while Whisper
+        is still working instead of adding ~50 ms before the paste.
+        """
+        # The stream stays open (and its callback idling) between sessions —
+        # re-opening PortAudio per recording costs 100-500 ms on first use.
         self.recording = False
-        if self.stream:
-            self.stream.stop()
-            self.stream.close()
-            self.stream = None
-        play_tone(440)  # low beep → recording stopped
-
-        if not self.frames:
-            log.info("No audio captured")
-            return None
+        self._beep(440)  # low beep → recording stopped
 
-        duration = sum(f.shape[0] for f in self.frames) / SAMPLE_RATE
+        duration = self._widx / SAMPLE_RATE
         if duration < MIN_DURATION_S:
             log.info("Recording too short (%.2fs), discarding", duration)
             notify("Voice Input", "Too short — cancelled")
+            if self._worker:
+                self._worker.join(timeout=2)
+            for fut in self._futures:
+                fut.cancel()
             return None
 
-        tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        save_wav(self.frames, tmp.name)
-        log.info("Saved %.2fs of audio to %s", duration, tmp.name)
-        return tmp.name
-
-    # -- transcribe + type (runs in background thread) ----------------------
-
-    def _handle_audio(self, wav_path: str):
+        log.info("Captured %.2fs of audio", duration)
+        clip_future = self._executor.submit(TextInserter._clip_get)
+        return self._worker, self._futures, clip_future
+
+    # -- streaming segmentation (runs for the lifetime of one recording) ----
+
+    def _segment_worker(self, futures: list):
+        """Drain the capture ring, batch utterances, transcribe on pauses.
+
+        Runs webrtcvad over 30 ms frames. A short pause (SEGMENT_SILENCE_S)
+        only marks an utterance boundary; adjacent utterances are coalesced
+        into one Whisper request and uploaded when the user stays silent for
+        FLUSH_SILENCE_S, when the batch approaches MAX_BATCH_S, or on stop —
+        halving request count versus one POST per utterance.
+        """
+        seg_start = 0       # sample index where the pending batch begins
+        processed = 0       # samples already fed through the VAD
+        voiced = False      # pending batch contains speech
+        silent_frames = 0
+        boundary = 0        # last utterance boundary inside the batch
+        boundary_frames = int(SEGMENT_SILENCE_S * 1000 / VAD_FRAME_MS)
+        flush_frames = int(FLUSH_SILENCE_S * 1000 / VAD_FRAME_MS)
+        max_batch = MAX_BATCH_S * SAMPLE_RATE
+
+        def flush(end: int):
+            nonlocal seg_start, voiced, boundary
+            pcm = bytes(self._ring_mv[seg_start * 2:end * 2])
+            seg_start = end
+            boundary = 0
+            # Anything left behind the VAD cursor belongs to the next batch
+            voiced = end < processed
+            futures.append(self._executor.submit(self._transcribe_segment, pcm))
+
+        while True:
+            if self._widx - processed >= VAD_FRAME_SAMPLES:
+                frame = bytes(self._ring_mv[processed * 2:
+                                            (processed + VAD_FRAME_SAMPLES) * 2])
+                processed += VAD_FRAME_SAMPLES
+                try:
+                    is_speech = self._vad.is_speech(frame, SAMPLE_RATE)
+                except Exception:
+                    is_speech = True  # fail open: treat as speech
+                if is_speech:
+                    voiced = True
+                    silent_frames = 0
+                elif voiced:
+                    silent_frames += 1
+                    if silent_frames == boundary_frames:
+                        boundary = processed
+                if not voiced:
+                    seg_start = processed  # don't batch leading silence
+                    continue
+                if silent_frames >= flush_frames:
+                    flush(processed)
+                elif processed - seg_start >= max_batch:
+                    # Cut at the last utterance boundary if we have one, so
+                    # the size limit doesn't split the user mid-word.
+                    flush(boundary if boundary > seg_start else processed)
+            elif self.recording:
+                time.sleep(VAD_FRAME_MS / 1000)
+            else:
+                break
+
+        # Final (possibly still-voiced) batch on stop
+        if voiced:
+            flush(self._widx)
+
+    def _transcribe_segment(self, pcm: bytes) -> str:
+        """Transcribe one raw int16 segment; returns its text (may be '')."""
+        audio = np.frombuffer(pcm, dtype=np.int16)
+        if audio.size == 0:
+            return ""
+        # Last-ditch energy gate: the VAD occasionally fires on steady hum
+        # or keyboard noise; don't pay an API round trip for it.
+        rms = np.sqrt(np.mean(np.square(audio, dtype=np.int64)))
+        if rms < RMS_SILENCE_THRESHOLD:
+            log.info("Segment RMS %.0f below noise floor, skipping upload", rms)
+            return ""
+        if UPLOAD_CODEC == "opus":
+            ogg = encode_opus(pcm)
+            if ogg is not None:
+                return transcribe_bytes(ogg, "segment.ogg", "audio/ogg")
+        return transcribe_bytes(encode_wav([audio]))
+
+    # -- assemble + type (runs in background thread) ------------------------
+
+    def _handle_audio(self, worker: threading.Thread, futures: list,
+                      clip_future=None):
         try:
             notify("Voice Input", "Transcribing...")
-            text = transcribe(wav_path)
+            worker.join()
+            texts = [fut.result() for fut in futures]
+            text = " ".join(t for t in texts if t).strip()
             if text:
                 log.info("Transcription: %s", text)
                 if self.inserter:
-                    self.inserter.type_text(text)
+                    old = clip_future.result() if clip_future else _UNSET
+                    with self._paste_lock:
+                        self.inserter.type_text(text, old=old)
                     notify("Voice Input", f"Typed: {text[:80]}")
                 else:
                     log.error("TextInserter not available")
@@ -302,11 +698,6 @@ class VoiceInputApp:
         except Exception as exc:
             log.error("Transcription/typing failed: %s", exc)
             notify("Voice Input Error", str(exc)[:200], urgency="critical")
-        finally:
-            try:
-                os.unlink(wav_path)
-            except OSError:
-                pass
 
     # -- main loop ----------------------------------------------------------
 
@@ -341,50 +732,87 @@ class VoiceInputApp:
                    urgency="critical")
             sys.exit(1)
 
+        # Warm the capture path so the first hotkey press doesn't pay
+        # PortAudio stream init; the callback idles until recording flips on
+        try:
+            self.stream = self._open_input_stream()
+        except Exception as exc:
+            log.warning("Could not pre-open input stream: %s", exc)
+
+        # Persistent beep output — skip per-beep device open/close latency
+        try:
+            self._out = sd.OutputStream(
+                samplerate=SAMPLE_RATE,
+                channels=1,
+                dtype="float32",
+                latency="low",
+                callback=self._output_callback,
+            )
+            self._out.start()
+        except Exception as exc:
+            log.warning("Persistent output stream unavailable: %s", exc)
+            self._out = None
+
         notify("Voice Input", "Ready — press Super+Shift+V to record")
         log.info("Listening for Super+Shift+V on %s", kbd.name)
 
-        pressed: set[int] = set()
+        # Warm the OpenAI connection off the critical path
+        threading.Thread(target=warm_session, daemon=True).start()
+
+        pressed = 0  # HOTKEY_BITS bitmask
         hotkey_active = False  # debounce
 
-        try:
-            for event in kbd.read_loop():
-                if self._shutdown.is_set():
-                    break
+        # epoll + batched kbd.read(): one syscall drains every pending event
+        # (bursts are common with held modifiers), and the poll timeout keeps
+        # shutdown responsive without a synthetic wake-up event.
+        poller = select.epoll()
+        poller.register(kbd.fd, select.EPOLLIN)
 
-                if event.type != ecodes.EV_KEY:
-                    continue
-
-                if event.value == 1:        # key down
-                    pressed.add(event.code)
-                elif event.value == 0:      # key up
-                    pressed.discard(event.code)
-
-                combo = is_hotkey_pressed(pressed)
-
-                if combo and not hotkey_active:
-                    hotkey_active = True
-                    if not self.recording:
-                        self.start_recording()
-                    else:
-                        wav = self.stop_recording()
-                        if wav:
-                            threading.Thread(
-                                target=self._handle_audio,
-                                args=(wav,),
-                                daemon=True,
-                            ).start()
-
-                if not combo:
-                    hotkey_active = False
+        try:
+            while not self._shutdown.is_set():
+                if not poller.poll(timeout=1.0):
+                    continue  # timeout — just re-check the shutdown flag
+
+                data = os.read(kbd.fd, _INPUT_EVENT_SIZE * 64)
+                for _sec, _usec, etype, code, value in \
+                        struct.iter_unpack(_INPUT_EVENT_FMT, data):
+                    if etype != ecodes.EV_KEY:
+                        continue
+
+                    bit = HOTKEY_BITS.get(code)
+                    if bit is None:
+                        continue
+                    if value == 1:              # key down
+                        pressed |= bit
+                    elif value == 0:            # key up
+                        pressed &= ~bit
+
+                    combo = is_hotkey_pressed(pressed)
+
+                    if combo and not hotkey_active:
+                        hotkey_active = True
+                        if not self.recording:
+                            self.start_recording()
+                        else:
+                            pending = self.stop_recording()
+                            if pending:
+                                self._handler_exec.submit(
+                                    self._handle_audio, *pending)
+
+                    if not combo:
+                        hotkey_active = False
 
         except KeyboardInterrupt:
             pass
         finally:
+            poller.close()
             log.info("Shutting down")
             if self.stream:
                 self.stream.stop()
                 self.stream.close()
+            if self._out:
+                self._out.stop()
+                self._out.close()
             if self.inserter:
                 self.inserter.close()
             kbd.close()